@@ -1,6 +1,18 @@
 # backend/config/citation_config.py
-import copy
-from typing import Dict, List
+from types import MappingProxyType
+from typing import FrozenSet, Mapping, Tuple
+
+
+def _check_unique_fields(table: Mapping[str, Tuple[str, ...]]) -> None:
+    """
+    Raise ValueError if any citation type lists the same required field twice.
+    """
+    for citation_type, fields in table.items():
+        # A set smaller than its tuple means a field was listed twice
+        if len(frozenset(fields)) != len(fields):
+            raise ValueError(
+                f"Duplicate required fields for citation type: {citation_type}"
+            )
 
 
 class CitationFieldsConfig:
@@ -10,19 +22,20 @@ class CitationFieldsConfig:
     """
 
     _instance = None
-    _initialized = False
 
     def __new__(cls) -> "CitationFieldsConfig":
         """
-        Create a new instance only if one doesn't exist.
+        Create and load the instance on first use, then keep returning it.
         """
         if cls._instance is None:
-            cls._instance = super(CitationFieldsConfig, cls).__new__(cls)
+            instance = super(CitationFieldsConfig, cls).__new__(cls)
+            instance._load_required_fields()
+            cls._instance = instance
         return cls._instance
 
-    def __init__(self) -> None:
+    def _load_required_fields(self) -> None:
         """
-        Initialize the configuration data only once.
+        Build the configuration data once for the singleton instance.
 
         Defines the required fields for each supported citation type:
         - book: Requires type, title, authors, year, publisher, place, edition
@@ -30,9 +43,9 @@ class CitationFieldsConfig:
         - website: Requires type, title, authors, year, publisher, url, access_date
         - report: Requires type, title, authors, year, publisher, url, place
         """
-        if not self._initialized:
-            self._required_for_citation_types = {
-                "book": [
+        self._required_for_citation_types = MappingProxyType(
+            {
+                "book": (
                     "type",
                     "title",
                     "authors",
@@ -40,8 +53,8 @@ class CitationFieldsConfig:
                     "publisher",
                     "place",
                     "edition",
-                ],
-                "article": [
+                ),
+                "article": (
                     "type",
                     "title",
                     "authors",
@@ -51,8 +64,8 @@ class CitationFieldsConfig:
                     "issue",
                     "pages",
                     "doi",
-                ],
-                "website": [
+                ),
+                "website": (
                     "type",
                     "title",
                     "authors",
@@ -60,8 +73,8 @@ class CitationFieldsConfig:
                     "publisher",
                     "url",
                     "access_date",
-                ],
-                "report": [
+                ),
+                "report": (
                     "type",
                     "title",
                     "authors",
@@ -69,37 +82,58 @@ class CitationFieldsConfig:
                     "publisher",
                     "url",
                     "place",
-                ],
+                ),
             }
+        )
+
+        # Read-only views are handed out directly, so callers never pay for a copy
+        self._supported_types = tuple(self._required_for_citation_types)
+        self._supported_types_set = frozenset(self._supported_types)
 
-            CitationFieldsConfig._initialized = True
+        # Frozen copies of each field list for fast membership checks
+        self._required_frozensets = {
+            citation_type: frozenset(fields)
+            for citation_type, fields in self._required_for_citation_types.items()
+        }
 
-    def get_required_for_citation_types(self) -> Dict[str, List[str]]:
+        _check_unique_fields(self._required_for_citation_types)
+
+    def get_required_for_citation_types(self) -> Mapping[str, Tuple[str, ...]]:
         """
-        Get the required fields for each citation type.
+        Get the required fields for each citation type as a read-only mapping.
         """
-        return copy.deepcopy(self._required_for_citation_types)
+        return self._required_for_citation_types
 
-    def get_required_fields(self, citation_type: str) -> List[str]:
+    def get_required_fields(self, citation_type: str) -> Tuple[str, ...]:
         """
         Get required fields for a specific citation type.
         """
-        if citation_type not in self._required_for_citation_types:
+        fields = self._required_for_citation_types.get(citation_type)
+        if fields is None:
+            raise KeyError(f"Unsupported citation type: {citation_type}")
+        return fields
+
+    def get_required_frozenset(self, citation_type: str) -> FrozenSet[str]:
+        """
+        Get required fields for a specific citation type as a cached frozenset.
+        """
+        fields = self._required_frozensets.get(citation_type)
+        if fields is None:
             raise KeyError(f"Unsupported citation type: {citation_type}")
-        return self._required_for_citation_types[citation_type].copy()
+        return fields
 
-    def get_supported_types(self) -> List[str]:
+    def get_supported_types(self) -> Tuple[str, ...]:
         """
         Get all supported citation types.
         """
-        return list(self._required_for_citation_types.keys())
+        return self._supported_types
 
     def is_valid_type(self, citation_type: str) -> bool:
         """
         Check if a citation type is supported.
         """
-        return citation_type in self._required_for_citation_types
+        return citation_type in self._supported_types_set
 
 
-# Global instance for easy access
-_config_instance = CitationFieldsConfig()
+# Global instance for easy access; CitationFieldsConfig() returns this same object
+citation_fields_config = CitationFieldsConfig()
@@ -34,7 +34,9 @@ app = FastAPI(
 # Uses ALLOWED_ORIGINS env var (comma-separated). Defaults to "*".
 _raw_origins = os.getenv("ALLOWED_ORIGINS")
 if _raw_origins:
-    allowed_origins = [origin.strip() for origin in _raw_origins.split(",") if origin.strip()]
+    allowed_origins = [
+        origin for origin in map(str.strip, _raw_origins.split(",")) if origin
+    ]
 else:
     allowed_origins = ["*"]
 
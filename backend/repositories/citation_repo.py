@@ -2,7 +2,7 @@
 import json
 from typing import Any, Dict, List, Optional
 
-from config.citation_config import CitationFieldsConfig
+from config.citation_config import citation_fields_config
 from models.citation import Citation
 from models.project_citation import ProjectCitation
 from sqlalchemy import inspect
@@ -18,7 +18,7 @@ def _get_citation_valid_fields() -> List[str]:
     ]
 
 
-CITATION_VALID_FIELDS = _get_citation_valid_fields()
+CITATION_VALID_FIELDS = frozenset(_get_citation_valid_fields())
 
 
 class CitationRepository:
@@ -126,13 +126,11 @@ class CitationRepository:
     ) -> Dict[str, Any]:
         """Merge citation with update data and filter by type."""
         # Prepare update data with proper JSON encoding for authors
-        processed_updates = {}
-        for key, value in update_data.items():
-            if key == "authors" and isinstance(value, list):
-                # Convert authors list to JSON string for database storage
-                processed_updates[key] = json.dumps(value)
-            else:
-                processed_updates[key] = value
+        processed_updates = dict(update_data)
+        authors_value = processed_updates.get("authors")
+        if isinstance(authors_value, list):
+            # Convert authors list to JSON string for database storage
+            processed_updates["authors"] = json.dumps(authors_value)
 
         # Get current citation data for comparison and merging
         current_data = {
@@ -153,18 +151,16 @@ class CitationRepository:
         }
 
         # Merge current data with updates, prioritizing new data
-        final_data = {**current_data}
-        for key, value in processed_updates.items():
-            final_data[key] = value
+        final_data = {**current_data, **processed_updates}
 
         # Filter fields by citation type
         citation_type = final_data.get("type", current_citation.type)
-        config = CitationFieldsConfig()
-        if config.is_valid_type(citation_type):
-            allowed_fields = config.get_required_fields(citation_type)
-            for field in CITATION_VALID_FIELDS:
-                if field not in allowed_fields:
-                    final_data[field] = None
+        if citation_fields_config.is_valid_type(citation_type):
+            allowed_fields = citation_fields_config.get_required_frozenset(
+                citation_type
+            )
+            for field in CITATION_VALID_FIELDS - allowed_fields:
+                final_data[field] = None
 
         return final_data
 
@@ -1,6 +1,7 @@
 # backend/schemas/citation_schemas.py
 import json
 import re
+import time
 from datetime import date, datetime
 from typing import List, Literal, Optional
 
@@ -12,6 +13,11 @@ from pydantic import (
     field_validator,
     model_validator,
 )
+from services.validators.constants import (
+    REQUIRED_BY_TYPE,
+    VALID_BY_TYPE,
+    format_invalid_fields,
+)
 
 # String length limits for validation
 MAX_TITLE_LENGTH = 500
@@ -23,6 +29,58 @@ MAX_DOI_LENGTH = 300
 MAX_PAGES_LENGTH = 50
 MAX_ISSUE_LENGTH = 50
 
+# Allowed author-name characters: letters, accented letters, whitespace, hyphens,
+# apostrophes and periods
+_NAME_RE = re.compile(r"^[a-zA-ZÀ-ÿ\s\-\'\.']+$")
+
+# DOI (10.xxxx/xxxx), page-range and page-character patterns, compiled once at import
+_DOI_RE = re.compile(r"^10\.\d{4,}/.+$")
+_PAGES_RE = re.compile(r"^\d+-\d+(?:\s*,\s*\d+-\d+)*$")
+_PAGES_UPDATE_RE = re.compile(r"^[\d\-\s,]+$")
+
+# Lenient DOI check for updates, equivalent to ^10\.\S+/\S+$ but the lookahead
+# finds the slash in one backward scan instead of retrying every split point
+_DOI_UPDATE_RE = re.compile(r"^10\.(?=\S+/\S)\S+$")
+
+# Cached current year and the monotonic time it expires, refreshed once per second
+_cached_year: int = 0
+_year_expiry: float = 0.0
+
+
+def _current_year() -> int:
+    """Return the current year, rebuilding the datetime at most once per second."""
+    global _cached_year, _year_expiry
+    # time.monotonic() is much cheaper than building a datetime for every check
+    now = time.monotonic()
+    if now >= _year_expiry:
+        _cached_year = datetime.now().year
+        _year_expiry = now + 1.0
+    return _cached_year
+
+
+def _reject_bool(value):
+    """Reject booleans, which lax int validation would coerce to 0 or 1."""
+    # Exact type check: bool subclasses int, so isinstance would accept it
+    if type(value) is bool:
+        raise ValueError("Value must be an integer, not a boolean")
+    return value
+
+
+def _validate_author_names(authors: List[str]) -> List[str]:
+    """Check each author name once for length and allowed characters."""
+    for author in authors:
+        # Strip once and reuse the result for every check
+        stripped = author.strip()
+        if len(stripped) > MAX_AUTHOR_NAME_LENGTH:
+            raise ValueError(
+                f"Author name exceeds {MAX_AUTHOR_NAME_LENGTH} characters"
+            )
+        if not _NAME_RE.match(stripped):
+            raise ValueError(
+                "Author names can only contain letters, spaces, hyphens, apostrophes, and periods"
+            )
+    return authors
+
 
 class CitationBase(BaseModel):
     """Base schema for citation validation with common fields and validators."""
@@ -67,31 +125,29 @@ class CitationBase(BaseModel):
     @classmethod
     def validate_authors(cls, v: List[str]) -> List[str]:
         """Validate author names - length and allowed characters."""
-        for author in v:
-            stripped = author.strip()
-            if len(stripped) > MAX_AUTHOR_NAME_LENGTH:
-                raise ValueError(
-                    f"Author name exceeds {MAX_AUTHOR_NAME_LENGTH} characters"
-                )
-            if not re.match(r"^[a-zA-ZÀ-ÿ\s\-\'\.']+$", stripped):
-                raise ValueError(
-                    "Author names can only contain letters, spaces, hyphens, apostrophes, and periods"
-                )
-        return v
+        return _validate_author_names(v)
+
+    @field_validator("year", "volume", "edition", mode="before")
+    @classmethod
+    def reject_bool_numbers(cls, v):
+        """Reject True/False for integer fields."""
+        return _reject_bool(v)
 
     @field_validator("year")
     @classmethod
     def validate_year_max(cls, v: Optional[int]) -> Optional[int]:
         """Validate year doesn't exceed current year."""
-        if v is not None and v > datetime.now().year:
-            raise ValueError(f"Year cannot exceed {datetime.now().year}")
+        if v is not None:
+            current_year = _current_year()
+            if v > current_year:
+                raise ValueError(f"Year cannot exceed {current_year}")
         return v
 
     @field_validator("doi")
     @classmethod
     def validate_doi_format(cls, v: Optional[str]) -> Optional[str]:
         """Validate DOI format (10.xxxx/xxxx)."""
-        if v is not None and not re.match(r"^10\.\d{4,}/.+$", v):
+        if v is not None and not _DOI_RE.match(v):
             raise ValueError("Invalid DOI format (expected: 10.xxxx/xxxx)")
         return v
 
@@ -103,8 +159,7 @@ class CitationBase(BaseModel):
             return v
 
         # Check pattern
-        single_range = r"\d+-\d+"
-        if not re.match(rf"^{single_range}(?:\s*,\s*{single_range})*$", v):
+        if not _PAGES_RE.match(v):
             raise ValueError(
                 "Pages must be in format 'start-end' or multiple ranges like '1-3, 5-7'"
             )
@@ -126,99 +181,31 @@ class CitationCreate(CitationBase):
     @model_validator(mode="after")
     def validate_required_fields_by_type(self):
         """Validate that all required fields for the citation type are present."""
-        # Define required and valid fields for each type
-        fields_config = {
-            "book": {
-                "required": ["type", "title", "authors", "year", "publisher", "place"],
-                "valid": [
-                    "type",
-                    "title",
-                    "authors",
-                    "year",
-                    "publisher",
-                    "place",
-                    "edition",
-                ],
-            },
-            "article": {
-                "required": [
-                    "type",
-                    "title",
-                    "authors",
-                    "year",
-                    "journal",
-                    "volume",
-                    "pages",
-                ],
-                "valid": [
-                    "type",
-                    "title",
-                    "authors",
-                    "year",
-                    "journal",
-                    "volume",
-                    "issue",
-                    "pages",
-                    "doi",
-                ],
-            },
-            "website": {
-                "required": [
-                    "type",
-                    "title",
-                    "authors",
-                    "year",
-                    "publisher",
-                    "url",
-                    "access_date",
-                ],
-                "valid": [
-                    "type",
-                    "title",
-                    "authors",
-                    "year",
-                    "publisher",
-                    "url",
-                    "access_date",
-                ],
-            },
-            "report": {
-                "required": ["type", "title", "authors", "year", "publisher", "place"],
-                "valid": [
-                    "type",
-                    "title",
-                    "authors",
-                    "year",
-                    "publisher",
-                    "url",
-                    "place",
-                ],
-            },
-        }
-
-        config = fields_config.get(self.type, {})
-        required_fields = config.get("required", [])
-        valid_fields = config.get("valid", [])
-
-        # Check for missing required fields
-        missing = [
-            field for field in required_fields if getattr(self, field, None) is None
-        ]
+        required_fields = REQUIRED_BY_TYPE.get(self.type, frozenset())
+        valid_fields = VALID_BY_TYPE.get(self.type, frozenset())
+
+        # Single pass over the model fields (declaration order) collecting both
+        # missing required fields and provided fields not valid for this type
+        missing = []
+        invalid_fields = []
+        for field, value in self:
+            if value is None:
+                if field in required_fields:
+                    missing.append(field)
+            elif field not in valid_fields:
+                invalid_fields.append(field)
+
+        # Report every problem at once so clients can fix them in one round trip
+        errors = []
         if missing:
-            raise ValueError(
-                f"Missing required {self.type} fields: {', '.join(missing)}"
-            )
-
-        # Check for invalid fields (fields not allowed for this type)
-        provided_fields = {
-            k for k, v in self.model_dump(exclude_none=False).items() if v is not None
-        }
-        invalid_fields = provided_fields - set(valid_fields)
+            errors.append(f"Missing required {self.type} fields: {', '.join(missing)}")
         if invalid_fields:
-            raise ValueError(
-                f"Invalid fields for {self.type}: {', '.join(invalid_fields)}. "
-                f"Valid fields: {', '.join(sorted(valid_fields))}"
+            # Fields not allowed for this type
+            errors.append(
+                format_invalid_fields(self.type, invalid_fields, valid_fields)
             )
+        if errors:
+            raise ValueError("; ".join(errors))
 
         return self
 
@@ -274,23 +261,19 @@ class CitationUpdate(BaseModel):
         """Validate author names - length and allowed characters."""
         if v is None:
             return v
-        for author in v:
-            stripped = author.strip()
-            if len(stripped) > MAX_AUTHOR_NAME_LENGTH:
-                raise ValueError(
-                    f"Author name exceeds {MAX_AUTHOR_NAME_LENGTH} characters"
-                )
-            if not re.match(r"^[a-zA-ZÀ-ÿ\s\-\'\.']+$", stripped):
-                raise ValueError(
-                    "Author names can only contain letters, spaces, hyphens, apostrophes, and periods"
-                )
-        return v
+        return _validate_author_names(v)
+
+    @field_validator("year", "volume", "edition", mode="before")
+    @classmethod
+    def reject_bool_numbers(cls, v):
+        """Reject True/False for integer fields."""
+        return _reject_bool(v)
 
     @field_validator("year")
     @classmethod
     def validate_year_max(cls, v: Optional[int]) -> Optional[int]:
         """Validate year doesn't exceed current year."""
-        if v is not None and v > datetime.now().year:
+        if v is not None and v > _current_year():
             raise ValueError(f"Year cannot be in the future")
         return v
 
@@ -298,7 +281,7 @@ class CitationUpdate(BaseModel):
     @classmethod
     def validate_doi_format(cls, v: Optional[str]) -> Optional[str]:
         """Validate DOI format (10.xxxx/xxxx)."""
-        if v is not None and not re.match(r"^10\.\S+/\S+$", v):
+        if v is not None and not _DOI_UPDATE_RE.match(v):
             raise ValueError("DOI must follow format: 10.xxxx/xxxx")
         return v
 
@@ -306,7 +289,7 @@ class CitationUpdate(BaseModel):
     @classmethod
     def validate_pages_format(cls, v: Optional[str]) -> Optional[str]:
         """Validate pages format and range logic (e.g., '123-145' or '1-3, 5-7')."""
-        if v is not None and not re.match(r"^[\d\-\s,]+$", v):
+        if v is not None and not _PAGES_UPDATE_RE.match(v):
             raise ValueError("Pages must contain only numbers, hyphens, commas, and spaces")
         return v
 
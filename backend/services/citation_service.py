@@ -9,8 +9,12 @@ from repositories.project_repo import ProjectRepository
 from schemas.citation_schemas import CitationCreate, CitationUpdate
 from services.formatters.apa_formatter import APAFormatter
 from services.formatters.mla_formatter import MLAFormatter
-from services.validators import (CitationTypeValidator,
-                                 ParameterValidator)
+from services.validators import (CitationTypeValidator, validate_exists,
+                                 validate_required)
+
+# Formatter classes by lowercase format name, shared by all service instances
+_FORMATTERS = {"apa": APAFormatter, "mla": MLAFormatter}
+_SUPPORTED_FORMATS_STR = ", ".join(_FORMATTERS)
 
 
 class CitationService:
@@ -76,15 +80,15 @@ class CitationService:
         self, citation_id: int, project_id: int, data: dict
     ) -> Citation:
         """Update citation with validation and duplicate detection."""
-        ParameterValidator.validate_required(citation_id, "citation_id")
-        ParameterValidator.validate_required(project_id, "project_id")
-        ParameterValidator.validate_required(data, "data")
+        validate_required(citation_id, "citation_id")
+        validate_required(project_id, "project_id")
+        validate_required(data, "data")
 
         project = self._project_repo.get_by_id(project_id)
-        ParameterValidator.validate_exists(project, "Project")
+        validate_exists(project, "Project")
 
         citation = self._citation_repo.get_by_id(citation_id)
-        ParameterValidator.validate_exists(citation, "Citation")
+        validate_exists(citation, "Citation")
 
         # Merge current citation data with updates
         merged_data = self._citation_repo.merge_citation_data(citation, data)
@@ -99,13 +103,6 @@ class CitationService:
                 detail="An identical citation already exists in this project",
             )
 
-        # Detect if citation type is being changed
-        current_type = citation.type
-        new_type = data.get("type")
-        type_change = (
-            new_type is not None and new_type.lower() != current_type.lower()
-        )
-
         # Validate the update data
         try:
             validated_data = CitationUpdate(**data)
@@ -115,7 +112,11 @@ class CitationService:
         # Get validated data and check type change if applicable
         citation_dict = validated_data.model_dump(exclude_none=True)
 
-        if type_change:
+        # CitationUpdate already lowercased the new type, so only the stored
+        # type needs normalizing to detect a type change
+        current_type = citation.type
+        new_type = citation_dict.get("type")
+        if new_type is not None and new_type != current_type.lower():
             CitationTypeValidator.validate_type_change(
                 citation_dict, new_type, current_type
             )
@@ -131,14 +132,14 @@ class CitationService:
 
     def delete_citation(self, citation_id: int, project_id: int) -> Dict[str, str]:
         """Delete citation and remove project associations."""
-        ParameterValidator.validate_required(citation_id, "citation_id")
-        ParameterValidator.validate_required(project_id, "project_id")
+        validate_required(citation_id, "citation_id")
+        validate_required(project_id, "project_id")
 
         project = self._project_repo.get_by_id(project_id)
-        ParameterValidator.validate_exists(project, "Project")
+        validate_exists(project, "Project")
 
         citation = self._citation_repo.get_by_id(citation_id)
-        ParameterValidator.validate_exists(citation, "Citation")
+        validate_exists(citation, "Citation")
 
         success = self._citation_repo.delete(
             citation_id=citation_id, project_id=project_id
@@ -151,13 +152,11 @@ class CitationService:
         """Format citation in APA or MLA style."""
         format_type = format_type.lower()
 
-        formatters = {"apa": APAFormatter, "mla": MLAFormatter}
-
-        formatter_class = formatters.get(format_type)
+        formatter_class = _FORMATTERS.get(format_type)
         if not formatter_class:
-            supported = ', '.join(formatters.keys())
             raise ValueError(
-                f"Unsupported format: {format_type}. Supported: {supported}"
+                f"Unsupported format: {format_type}. "
+                f"Supported: {_SUPPORTED_FORMATS_STR}"
             )
 
         formatter = formatter_class(citation)
@@ -52,11 +52,7 @@ class APAFormatter(BaseCitationFormatter):
                 if clean_word.upper() in APA_ACRONYMS:
                     sentence_words.append(clean_word.upper() + punctuation)
                 # Check if it's a short all-caps acronym (2-5 letters, all uppercase)
-                elif (
-                    len(clean_word) >= 2
-                    and len(clean_word) <= 5
-                    and clean_word.isupper()
-                ):
+                elif 2 <= len(clean_word) <= 5 and clean_word.isupper():
                     sentence_words.append(word)  # Keep short acronyms as is
                 # First word of title or first word after colon - capitalize
                 elif i == 0:
@@ -75,17 +71,17 @@ class APAFormatter(BaseCitationFormatter):
         authors = self._get_authors_list()
         formatted_authors = self._format_authors(authors)
 
-        formatters = {
-            "book": self._format_book,
-            "article": self._format_article,
-            "website": self._format_website,
-            "report": self._format_report,
-        }
-
-        formatter = formatters.get(self._citation.type)
-        if formatter:
-            return formatter(formatted_authors)
-        return f"Unsupported citation type: {self._citation.type}"
+        # Plain comparisons avoid building a dict of bound methods per citation
+        citation_type = self._citation.type
+        if citation_type == "book":
+            return self._format_book(formatted_authors)
+        if citation_type == "article":
+            return self._format_article(formatted_authors)
+        if citation_type == "website":
+            return self._format_website(formatted_authors)
+        if citation_type == "report":
+            return self._format_report(formatted_authors)
+        return f"Unsupported citation type: {citation_type}"
 
     def _format_authors(self, authors: List[str]) -> str:
         """Format authors per APA 7th edition with ampersand before last author."""
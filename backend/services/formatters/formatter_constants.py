@@ -288,3 +288,19 @@ MLA_LOWERCASE_WORDS = {
     "should",
     "might",
 }
+
+# MLA: Abbreviated month names for access dates, indexed by month number
+MLA_MONTH_ABBREVIATIONS = {
+    1: "Jan.",
+    2: "Feb.",
+    3: "Mar.",
+    4: "Apr.",
+    5: "May",
+    6: "Jun.",
+    7: "Jul.",
+    8: "Aug.",
+    9: "Sep.",
+    10: "Oct.",
+    11: "Nov.",
+    12: "Dec.",
+}
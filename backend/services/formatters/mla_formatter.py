@@ -1,13 +1,20 @@
 # backend/services/formatters/mla_formatter.py
-from datetime import datetime
+import re
+from datetime import date
 from typing import TYPE_CHECKING, List
 
 from .base_citation_formatter import BaseCitationFormatter
-from .formatter_constants import MLA_LOWERCASE_WORDS
+from .formatter_constants import MLA_LOWERCASE_WORDS, MLA_MONTH_ABBREVIATIONS
 
 if TYPE_CHECKING:
     from models.citation import Citation
 
+# The %Y, %m and %d patterns strptime("%Y-%m-%d") uses, so both accept the same
+# strings; month and day take ASCII digits only, apart from a day's second digit
+_DATE_RE = re.compile(
+    r"(\d{4})-(1[0-2]|0[1-9]|[1-9])-(3[01]|[12]\d|0[1-9]|[1-9]| [1-9])"
+)
+
 
 class MLAFormatter(BaseCitationFormatter):
     """Format citations according to MLA 9th edition guidelines."""
@@ -55,17 +62,17 @@ class MLAFormatter(BaseCitationFormatter):
         authors = self._get_authors_list()
         formatted_authors = self._format_authors(authors)
 
-        formatters = {
-            "book": self._format_book,
-            "article": self._format_article,
-            "website": self._format_website,
-            "report": self._format_report,
-        }
-
-        formatter = formatters.get(self._citation.type)
-        if formatter:
-            return formatter(formatted_authors)
-        return f"Unsupported citation type: {self._citation.type}"
+        # Plain comparisons avoid building a dict of bound methods per citation
+        citation_type = self._citation.type
+        if citation_type == "book":
+            return self._format_book(formatted_authors)
+        if citation_type == "article":
+            return self._format_article(formatted_authors)
+        if citation_type == "website":
+            return self._format_website(formatted_authors)
+        if citation_type == "report":
+            return self._format_report(formatted_authors)
+        return f"Unsupported citation type: {citation_type}"
 
     def _format_authors(self, authors: List[str]) -> str:
         """Format authors per MLA style with first author inverted, et al. for 4+."""
@@ -109,29 +116,21 @@ class MLAFormatter(BaseCitationFormatter):
 
     def _format_access_date(self, date_str: str) -> str:
         """Convert YYYY-MM-DD to MLA access date format (Accessed Day Mon. Year)."""
+        match = _DATE_RE.fullmatch(date_str)
+        if not match:
+            # Fallback if date format is not as expected
+            return f"Accessed {date_str}"
+        parts = match.groups()
         try:
-            dt = datetime.strptime(date_str, "%Y-%m-%d")
+            # Build the date directly, which rejects impossible dates like strptime does
+            dt = date(int(parts[0]), int(parts[1]), int(parts[2]))
             # Format with day without leading zero, abbreviated month with period, year
             day = str(dt.day)  # Remove leading zero
-            month_map = {
-                1: "Jan.",
-                2: "Feb.",
-                3: "Mar.",
-                4: "Apr.",
-                5: "May",
-                6: "Jun.",
-                7: "Jul.",
-                8: "Aug.",
-                9: "Sep.",
-                10: "Oct.",
-                11: "Nov.",
-                12: "Dec.",
-            }
-            month = month_map[dt.month]
+            month = MLA_MONTH_ABBREVIATIONS[dt.month]
             year = str(dt.year)
             return f"Accessed {day} {month} {year}"
         except ValueError:
-            # Fallback if date format is not as expected
+            # Fallback if the date does not exist (e.g. 2023-02-30)
             return f"Accessed {date_str}"
 
     def _format_book(self, authors: str) -> str:
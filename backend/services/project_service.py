@@ -9,7 +9,7 @@ from repositories.citation_repo import CitationRepository
 from repositories.project_repo import ProjectRepository
 from schemas.project_schemas import ProjectCreate, ProjectUpdate
 from services.citation_service import CitationService
-from services.validators import ParameterValidator
+from services.validators import validate_exists, validate_required, validate_unique
 
 
 class ProjectService:
@@ -23,7 +23,7 @@ class ProjectService:
 
     def create_project(self, data: dict) -> Project:
         """Create a new project with validation and uniqueness checking."""
-        ParameterValidator.validate_required(data, "data")
+        validate_required(data, "data")
 
         try:
             validated_data = ProjectCreate(**data)
@@ -32,18 +32,16 @@ class ProjectService:
 
         # Check name uniqueness
         existing_project = self._project_repo.get_by_name(validated_data.name.strip())
-        ParameterValidator.validate_unique(
-            bool(existing_project), validated_data.name, "Project"
-        )
+        validate_unique(bool(existing_project), validated_data.name, "Project")
 
         return self._project_repo.create(validated_data.model_dump())
 
     def get_project(self, project_id: int) -> Project:
         """Retrieve a project by its unique identifier."""
-        ParameterValidator.validate_required(project_id, "project_id")
+        validate_required(project_id, "project_id")
 
         project = self._project_repo.get_by_id(project_id)
-        ParameterValidator.validate_exists(project, "Project")
+        validate_exists(project, "Project")
         return project
 
     def get_all_projects(self) -> List[Project]:
@@ -52,8 +50,8 @@ class ProjectService:
 
     def update_project(self, project_id: int, data: dict) -> Project:
         """Update an existing project with validation and uniqueness checking."""
-        ParameterValidator.validate_required(project_id, "project_id")
-        ParameterValidator.validate_required(data, "data")
+        validate_required(project_id, "project_id")
+        validate_required(data, "data")
 
         try:
             validated_data = ProjectUpdate(**data)
@@ -69,15 +67,15 @@ class ProjectService:
             )
 
         project = self._project_repo.update(project_id, **validated_data.model_dump())
-        ParameterValidator.validate_exists(project, "Project")
+        validate_exists(project, "Project")
         return project
 
     def delete_project(self, project_id: int) -> Dict[str, str]:
         """Delete a project from the system along with its citation associations."""
-        ParameterValidator.validate_required(project_id, "project_id")
+        validate_required(project_id, "project_id")
 
         project = self._project_repo.get_by_id(project_id)
-        ParameterValidator.validate_exists(project, "Project")
+        validate_exists(project, "Project")
 
         success = self._project_repo.delete(project_id)
         if not success:
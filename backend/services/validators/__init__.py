@@ -6,15 +6,27 @@ from services.validators.constants import (
     CITATION_TYPES_CONFIG,
     DATE_FORMAT,
     DEFAULT_FORMAT,
+    REQUIRED_BY_TYPE,
     SUPPORTED_FORMATS,
+    VALID_BY_TYPE,
+)
+from services.validators.validators import (
+    validate_exists,
+    validate_not_duplicate,
+    validate_required,
+    validate_unique,
 )
-from services.validators.validators import ParameterValidator
 
 __all__ = [
-    "ParameterValidator",
+    "validate_required",
+    "validate_exists",
+    "validate_unique",
+    "validate_not_duplicate",
     "CitationTypeValidator",
     "SUPPORTED_FORMATS",
     "DEFAULT_FORMAT",
     "DATE_FORMAT",
     "CITATION_TYPES_CONFIG",
+    "REQUIRED_BY_TYPE",
+    "VALID_BY_TYPE",
 ]
@@ -1,6 +1,10 @@
 # backend/services/validators/citation_type_validator.py
 from fastapi import HTTPException
-from services.validators.constants import CITATION_TYPES_CONFIG
+from services.validators.constants import (
+    REQUIRED_BY_TYPE,
+    VALID_BY_TYPE,
+    format_invalid_fields,
+)
 
 
 class CitationTypeValidator:
@@ -13,20 +17,13 @@ class CitationTypeValidator:
         current_type_lower = current_type.lower()
 
         # Check for invalid fields
-        valid_fields = CitationTypeValidator.get_valid_fields(new_type_lower)
-        provided_fields = set(data.keys())
-        invalid_fields = provided_fields - valid_fields
-
-        if invalid_fields:
-            raise HTTPException(
-                status_code=400,
-                detail=f"Invalid fields for new type {new_type}: {', '.join(invalid_fields)}. "
-                f"Valid fields: {', '.join(sorted(valid_fields))}",
-            )
+        valid_fields = VALID_BY_TYPE.get(new_type_lower, frozenset())
+        # dict_keys supports set difference directly, no intermediate set needed
+        invalid_fields = data.keys() - valid_fields
 
         # Check for missing required fields
-        new_required = CitationTypeValidator.get_required_fields(new_type_lower)
-        current_required = CitationTypeValidator.get_required_fields(current_type_lower)
+        new_required = REQUIRED_BY_TYPE.get(new_type_lower, frozenset())
+        current_required = REQUIRED_BY_TYPE.get(current_type_lower, frozenset())
         additional_required = new_required - current_required
 
         missing = [
@@ -35,20 +32,17 @@ class CitationTypeValidator:
             if field not in data and field != "type"
         ]
 
+        # Report every problem in a single exception instead of one per request
+        errors = []
+        if invalid_fields:
+            errors.append(
+                format_invalid_fields(
+                    f"new type {new_type}", invalid_fields, valid_fields
+                )
+            )
         if missing:
-            raise HTTPException(
-                status_code=400,
-                detail=f"When changing to type '{new_type}', the following fields are required: {', '.join(missing)}",
+            errors.append(
+                f"When changing to type '{new_type}', the following fields are required: {', '.join(missing)}"
             )
-
-    @staticmethod
-    def get_required_fields(citation_type: str) -> set:
-        """Get required fields for a citation type from configuration."""
-        config = CITATION_TYPES_CONFIG.get(citation_type.lower(), {})
-        return set(config.get("required", []))
-
-    @staticmethod
-    def get_valid_fields(citation_type: str) -> set:
-        """Get all valid fields for a citation type from configuration."""
-        config = CITATION_TYPES_CONFIG.get(citation_type.lower(), {})
-        return set(config.get("valid", []))
+        if errors:
+            raise HTTPException(status_code=400, detail="; ".join(errors))
@@ -50,6 +50,25 @@ CITATION_TYPES_CONFIG = {
     },
 }
 
+# Required and valid field sets per citation type, frozen once at import
+REQUIRED_BY_TYPE = {
+    citation_type: frozenset(config["required"])
+    for citation_type, config in CITATION_TYPES_CONFIG.items()
+}
+VALID_BY_TYPE = {
+    citation_type: frozenset(config["valid"])
+    for citation_type, config in CITATION_TYPES_CONFIG.items()
+}
+
+
+def format_invalid_fields(label: str, invalid_fields, valid_fields) -> str:
+    """Build the error message listing fields not allowed for a citation type."""
+    return (
+        f"Invalid fields for {label}: {', '.join(invalid_fields)}. "
+        f"Valid fields: {', '.join(sorted(valid_fields))}"
+    )
+
+
 # Fields used for serialization in database
 SERIALIZATION_FIELDS = {
     "date_fields": ["access_date"],
@@ -0,0 +1,34 @@
+# backend/tests/formatter_helpers.py
+"""Helpers shared by the APA and MLA formatter tests."""
+from types import SimpleNamespace
+
+# Formatters only read attributes, so most tests use a plain stub, not the ORM model
+_CITATION_DEFAULTS = dict.fromkeys(
+    (
+        "type",
+        "title",
+        "authors",
+        "year",
+        "publisher",
+        "journal",
+        "volume",
+        "issue",
+        "pages",
+        "doi",
+        "url",
+        "access_date",
+        "place",
+        "edition",
+    )
+)
+
+
+def cite(**fields):
+    """Build an attribute-only Citation stand-in with unset fields as None."""
+    return SimpleNamespace(**{**_CITATION_DEFAULTS, **fields})
+
+
+def format_by_type(formatter):
+    """Run the type-specific _format_* method on the citation's parsed authors."""
+    type_formatter = getattr(formatter, f"_format_{formatter._citation.type}")
+    return type_formatter(formatter._format_authors(formatter._get_authors_list()))
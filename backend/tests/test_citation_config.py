@@ -1,210 +1,177 @@
 # backend/tests/test_citation_config.py
-import pytest
-from config.citation_config import CitationFieldsConfig
+from types import MappingProxyType
 
-def test_singleton_behavior():
+import pytest
+from config.citation_config import CitationFieldsConfig, _check_unique_fields
+
+# Expected required fields per type, built once for the whole module
+_BOOK_FIELDS = ("type", "title", "authors", "year", "publisher", "place", "edition")
+_ARTICLE_FIELDS = (
+    "type",
+    "title",
+    "authors",
+    "year",
+    "journal",
+    "volume",
+    "issue",
+    "pages",
+    "doi",
+)
+_WEBSITE_FIELDS = (
+    "type",
+    "title",
+    "authors",
+    "year",
+    "publisher",
+    "url",
+    "access_date",
+)
+_REPORT_FIELDS = ("type", "title", "authors", "year", "publisher", "url", "place")
+
+
+def test_singleton_behavior(fields_config):
     """Test that CitationFieldsConfig follows singleton pattern."""
-    config1 = CitationFieldsConfig()
-    config2 = CitationFieldsConfig()
-    assert config1 is config2, "CitationFieldsConfig should return the same instance"
-
-
-def test_singleton_has_same_id():
-    """Test that multiple CitationFieldsConfig instances have the same ID."""
-    config1 = CitationFieldsConfig()
-    config2 = CitationFieldsConfig()
-
-    # Both instances should be the exact same object
-    assert id(config1) == id(config2), "Singleton instances should have identical IDs"
-
-
-def test_singleton_initialization_only_once():
-    """Test that singleton initialization happens only once."""
-    # This test verifies that multiple instantiations don't re-initialize the data
-    config1 = CitationFieldsConfig()
-    original_types = config1.get_supported_types()
-
-    # Create another instance
-    config2 = CitationFieldsConfig()
-    new_types = config2.get_supported_types()
-
-    # Both should return the same data and be the same instance
-    assert config1 is config2, "Should be the same instance"
-    assert original_types == new_types, "Data should be identical"
-
-
-def test_get_required_fields_book():
-    """Test get_required_fields returns exact expected list for book."""
-    config = CitationFieldsConfig()
-    expected_fields = [
-        "type",
-        "title",
-        "authors",
-        "year",
-        "publisher",
-        "place",
-        "edition",
-    ]
-    actual_fields = config.get_required_fields("book")
     assert (
-        actual_fields == expected_fields
-    ), f"Expected {expected_fields}, got {actual_fields}"
-
-
-def test_get_required_fields_article():
-    """Test get_required_fields returns exact expected list for article."""
-    config = CitationFieldsConfig()
-    expected_fields = [
-        "type",
-        "title",
-        "authors",
-        "year",
-        "journal",
-        "volume",
-        "issue",
-        "pages",
-        "doi",
-    ]
-    actual_fields = config.get_required_fields("article")
+        CitationFieldsConfig() is fields_config
+    ), "CitationFieldsConfig should return the same instance"
+    assert CitationFieldsConfig().get_supported_types() == (
+        fields_config.get_supported_types()
+    ), "Re-instantiation should not re-initialize the data"
+
+
+def test_duplicate_required_field_raises_valueerror():
+    """Test that a field list naming the same field twice raises ValueError."""
+    table = {"book": _BOOK_FIELDS, "article": _ARTICLE_FIELDS + ("title",)}
+
+    with pytest.raises(
+        ValueError, match="Duplicate required fields for citation type: article"
+    ):
+        _check_unique_fields(table)
+
+
+def test_shipped_required_fields_pass_duplicate_check(fields_config):
+    """Test that the shipped field lists pass the duplicate check."""
+    _check_unique_fields(fields_config.get_required_for_citation_types())
+
+
+@pytest.mark.parametrize(
+    "citation_type, expected_fields",
+    [
+        ("book", _BOOK_FIELDS),
+        ("article", _ARTICLE_FIELDS),
+        ("website", _WEBSITE_FIELDS),
+        ("report", _REPORT_FIELDS),
+    ],
+)
+def test_get_required_fields(fields_config, citation_type, expected_fields):
+    """Test get_required_fields returns exact expected fields for each type."""
+    actual_fields = fields_config.get_required_fields(citation_type)
     assert (
         actual_fields == expected_fields
     ), f"Expected {expected_fields}, got {actual_fields}"
 
 
-def test_get_required_fields_website():
-    """Test get_required_fields returns exact expected list for website."""
-    config = CitationFieldsConfig()
-    expected_fields = [
-        "type",
-        "title",
-        "authors",
-        "year",
-        "publisher",
-        "url",
-        "access_date",
-    ]
-    actual_fields = config.get_required_fields("website")
-    assert (
-        actual_fields == expected_fields
-    ), f"Expected {expected_fields}, got {actual_fields}"
+@pytest.mark.parametrize(
+    "citation_type, message",
+    [
+        ("banana", "Unsupported citation type: banana"),
+        ("", "Unsupported citation type: '"),
+        (None, "Unsupported citation type: None"),
+    ],
+    ids=["unsupported_type", "empty_string", "none_type"],
+)
+def test_get_required_fields_invalid_type_raises_keyerror(
+    fields_config, citation_type, message
+):
+    """Test that unsupported, empty and None types raise KeyError."""
+    with pytest.raises(KeyError, match=message):
+        fields_config.get_required_fields(citation_type)
 
 
-def test_get_required_fields_report():
-    """Test get_required_fields returns exact expected list for report."""
-    config = CitationFieldsConfig()
-    expected_fields = ["type", "title", "authors", "year", "publisher", "url", "place"]
-    actual_fields = config.get_required_fields("report")
-    assert (
-        actual_fields == expected_fields
-    ), f"Expected {expected_fields}, got {actual_fields}"
-
+def test_get_required_frozenset_matches_required_fields(fields_config):
+    """Test get_required_frozenset contains the same fields as get_required_fields."""
+    for citation_type in fields_config.get_supported_types():
+        fields = fields_config.get_required_frozenset(citation_type)
+        assert isinstance(fields, frozenset), "Should return a frozenset"
+        assert fields == set(fields_config.get_required_fields(citation_type))
 
-def test_get_required_fields_unsupported_type_raises_keyerror():
-    """Test that unsupported types raise KeyError."""
-    config = CitationFieldsConfig()
-    with pytest.raises(KeyError) as exc_info:
-        config.get_required_fields("banana")
-    assert "Unsupported citation type: banana" in str(exc_info.value)
 
+def test_get_required_frozenset_returns_cached_instance(fields_config):
+    """Test get_required_frozenset returns the same object on every call."""
+    book_fields = fields_config.get_required_frozenset("book")
+    assert fields_config.get_required_frozenset("book") is book_fields
 
-def test_get_required_fields_empty_string_raises_keyerror():
-    """Test that empty string type raises KeyError."""
-    config = CitationFieldsConfig()
-    with pytest.raises(KeyError, match="Unsupported citation type"):
-        config.get_required_fields("")
 
+def test_get_required_frozenset_unsupported_type_raises_keyerror(fields_config):
+    """Test that get_required_frozenset raises KeyError for unsupported types."""
+    with pytest.raises(KeyError, match="Unsupported citation type: banana"):
+        fields_config.get_required_frozenset("banana")
 
-def test_get_required_fields_none_type_raises_keyerror():
-    """Test that None type raises KeyError."""
-    config = CitationFieldsConfig()
-    with pytest.raises(KeyError):
-        config.get_required_fields(None)
 
-
-def test_is_valid_type_valid_types():
+@pytest.mark.parametrize("citation_type", ["book", "article", "website", "report"])
+def test_is_valid_type_valid_types(fields_config, citation_type):
     """Test is_valid_type returns True for valid citation types."""
-    config = CitationFieldsConfig()
-    valid_types = ["book", "article", "website", "report"]
-
-    for citation_type in valid_types:
-        assert config.is_valid_type(
-            citation_type
-        ), f"Type '{citation_type}' should be valid"
+    assert fields_config.is_valid_type(
+        citation_type
+    ), f"Type '{citation_type}' should be valid"
 
 
-def test_is_valid_type_invalid_types():
+@pytest.mark.parametrize("citation_type", ["banana", "movie", "song", "invalid", ""])
+def test_is_valid_type_invalid_types(fields_config, citation_type):
     """Test is_valid_type returns False for invalid citation types."""
-    config = CitationFieldsConfig()
-    invalid_types = ["banana", "movie", "song", "invalid", ""]
+    assert not fields_config.is_valid_type(
+        citation_type
+    ), f"Type '{citation_type}' should be invalid"
 
-    for citation_type in invalid_types:
-        assert not config.is_valid_type(
-            citation_type
-        ), f"Type '{citation_type}' should be invalid"
 
-
-def test_is_valid_type_case_sensitive():
+def test_is_valid_type_case_sensitive(fields_config):
     """Test that is_valid_type is case-sensitive."""
-    config = CitationFieldsConfig()
-
     # Valid types are lowercase
-    assert config.is_valid_type("book") is True
-    assert config.is_valid_type("BOOK") is False
-    assert config.is_valid_type("Book") is False
-    assert config.is_valid_type("article") is True
-    assert config.is_valid_type("ARTICLE") is False
+    assert fields_config.is_valid_type("book") is True
+    assert fields_config.is_valid_type("BOOK") is False
+    assert fields_config.is_valid_type("Book") is False
+    assert fields_config.is_valid_type("article") is True
+    assert fields_config.is_valid_type("ARTICLE") is False
 
 
-def test_is_valid_type_with_none():
+def test_is_valid_type_with_none(fields_config):
     """Test is_valid_type returns False for None."""
-    config = CitationFieldsConfig()
     # is_valid_type uses "in" operator which handles None gracefully
-    assert config.is_valid_type(None) is False
+    assert fields_config.is_valid_type(None) is False
 
 
-def test_get_supported_types():
-    """Test get_supported_types returns exactly the expected types."""
-    config = CitationFieldsConfig()
-    expected_types = {"book", "article", "website", "report"}
-    actual_types = set(config.get_supported_types())
+def test_get_supported_types(fields_config):
+    """Test get_supported_types returns exactly the expected types in order."""
+    expected_types = ("book", "article", "website", "report")
+    actual_types = fields_config.get_supported_types()
     assert (
         actual_types == expected_types
     ), f"Expected {expected_types}, got {actual_types}"
 
 
-def test_get_supported_types_returns_list():
-    """Test that get_supported_types returns a list."""
-    config = CitationFieldsConfig()
-    supported_types = config.get_supported_types()
+def test_accessor_return_types(fields_config):
+    """Test that the config accessors return read-only containers."""
+    assert isinstance(fields_config.get_supported_types(), tuple)
+    assert isinstance(fields_config.get_required_fields("book"), tuple)
+    assert isinstance(fields_config.get_required_for_citation_types(), MappingProxyType)
 
-    assert isinstance(supported_types, list), "Should return a list"
-    assert len(supported_types) == 4, "Should have exactly 4 supported types"
 
+def test_get_required_for_citation_types_returns_cached_instance(fields_config):
+    """Test get_required_for_citation_types returns the same proxy on every call."""
+    all_requirements = fields_config.get_required_for_citation_types()
+    assert fields_config.get_required_for_citation_types() is all_requirements
+    assert fields_config.get_required_fields("book") is all_requirements["book"]
 
-def test_get_supported_types_has_all_types():
-    """Test that get_supported_types includes all expected types."""
-    config = CitationFieldsConfig()
-    supported_types = config.get_supported_types()
 
-    assert "book" in supported_types
-    assert "article" in supported_types
-    assert "website" in supported_types
-    assert "report" in supported_types
+def test_get_supported_types_returns_cached_instance(fields_config):
+    """Test get_supported_types returns the same tuple on every call."""
+    supported_types = fields_config.get_supported_types()
+    assert fields_config.get_supported_types() is supported_types
 
 
-def test_get_required_for_citation_types_returns_dict():
-    """Test that get_required_for_citation_types returns a dictionary."""
-    config = CitationFieldsConfig()
-    all_requirements = config.get_required_for_citation_types()
-
-    assert isinstance(all_requirements, dict), "Should return a dictionary"
-    assert len(all_requirements) == 4, "Should have exactly 4 citation types"
-
-
-def test_get_required_for_citation_types_has_all_types():
+def test_get_required_for_citation_types_has_all_types(fields_config):
     """Test that get_required_for_citation_types includes all types."""
-    config = CitationFieldsConfig()
-    all_requirements = config.get_required_for_citation_types()
+    all_requirements = fields_config.get_required_for_citation_types()
 
     assert "book" in all_requirements
     assert "article" in all_requirements
@@ -212,174 +179,75 @@ def test_get_required_for_citation_types_has_all_types():
     assert "report" in all_requirements
 
 
-def test_get_required_for_citation_types_each_has_fields():
-    """Test that each type in get_required_for_citation_types has required fields."""
-    config = CitationFieldsConfig()
-    all_requirements = config.get_required_for_citation_types()
+def test_data_immutability_required_for_citation_types(fields_config):
+    """Test that returned data from get_required_for_citation_types is immutable."""
+    types_dict = fields_config.get_required_for_citation_types()
 
-    for citation_type, fields in all_requirements.items():
-        assert isinstance(fields, list), f"{citation_type} should have a list of fields"
-        assert (
-            len(fields) > 0
-        ), f"{citation_type} should have at least one required field"
+    with pytest.raises(TypeError):
+        types_dict["new_type"] = ("field1", "field2")
 
+    assert "new_type" not in fields_config.get_required_for_citation_types()
 
-def test_data_immutability_required_for_citation_types():
-    """Test that returned data from get_required_for_citation_types is immutable."""
-    config = CitationFieldsConfig()
 
-    # Get the data
-    types_dict = config.get_required_for_citation_types()
+def test_data_immutability_get_required_fields(fields_config):
+    """Test that returned data from get_required_fields is immutable."""
+    book_fields = fields_config.get_required_fields("book")
 
-    # Try to modify it
-    types_dict["new_type"] = ["field1", "field2"]
+    with pytest.raises(TypeError):
+        book_fields[0] = "new_field"
 
-    # Get fresh data and verify it wasn't modified
-    fresh_types_dict = config.get_required_for_citation_types()
-    assert (
-        "new_type" not in fresh_types_dict
-    ), "Returned data should be a copy, not a reference"
+    assert "new_field" not in fields_config.get_required_fields("book")
 
 
-def test_data_immutability_get_required_fields():
-    """Test that returned data from get_required_fields is immutable."""
-    config = CitationFieldsConfig()
+def test_data_immutability_get_supported_types(fields_config):
+    """Test that returned data from get_supported_types is immutable."""
+    supported_types = fields_config.get_supported_types()
 
-    # Get the data
-    book_fields = config.get_required_fields("book")
-    original_length = len(book_fields)
+    with pytest.raises(TypeError):
+        supported_types[0] = "fake_type"
 
-    # Try to modify it
-    book_fields.append("new_field")
+    assert "fake_type" not in fields_config.get_supported_types()
 
-    # Get fresh data and verify it wasn't modified
-    fresh_book_fields = config.get_required_fields("book")
-    assert (
-        len(fresh_book_fields) == original_length
-    ), "Returned data should be a copy, not a reference"
-    assert "new_field" not in fresh_book_fields, "Original data should not be modified"
 
+def test_data_immutability_nested_list_modification(fields_config):
+    """Test that the nested field sequences cannot be modified."""
+    all_requirements = fields_config.get_required_for_citation_types()
 
-def test_data_immutability_get_supported_types():
-    """Test that returned data from get_supported_types is immutable."""
-    config = CitationFieldsConfig()
-
-    # Get the data
-    supported_types = config.get_supported_types()
-    original_length = len(supported_types)
-
-    # Try to modify it
-    supported_types.append("fake_type")
-
-    # Get fresh data and verify it wasn't modified
-    fresh_types = config.get_supported_types()
-    assert len(fresh_types) == original_length, "Returned data should be a copy"
-    assert "fake_type" not in fresh_types, "Original data should not be modified"
-
-
-def test_data_immutability_nested_list_modification():
-    """Test that modifying nested lists doesn't affect internal data."""
-    config = CitationFieldsConfig()
-
-    # Get all requirements
-    all_requirements = config.get_required_for_citation_types()
-
-    # Try to modify the nested list for book
-    all_requirements["book"].append("fake_field")
-
-    # Get fresh data and verify nested list wasn't modified
-    fresh_book_fields = config.get_required_fields("book")
-    assert "fake_field" not in fresh_book_fields, "Nested list should not be modified"
-
-def test_all_citation_types_have_required_fields():
-    """Test that all supported citation types have required fields defined."""
-    config = CitationFieldsConfig()
-    supported_types = config.get_supported_types()
-
-    for citation_type in supported_types:
-        fields = config.get_required_fields(citation_type)
-        assert isinstance(
-            fields, list
-        ), f"Required fields for {citation_type} should be a list"
-        assert (
-            len(fields) > 0
-        ), f"Required fields for {citation_type} should not be empty"
-        assert (
-            "type" in fields
-        ), f"'type' should be a required field for {citation_type}"
-        assert (
-            "title" in fields
-        ), f"'title' should be a required field for {citation_type}"
-        assert (
-            "authors" in fields
-        ), f"'authors' should be a required field for {citation_type}"
-        assert (
-            "year" in fields
-        ), f"'year' should be a required field for {citation_type}"
-
-
-def test_all_required_fields_are_strings():
-    """Test that all required field names are strings."""
-    config = CitationFieldsConfig()
-    all_requirements = config.get_required_for_citation_types()
-
-    for citation_type, fields in all_requirements.items():
-        for field in fields:
-            assert isinstance(
-                field, str
-            ), f"Field '{field}' in {citation_type} should be a string"
-            assert len(field) > 0, f"Field name in {citation_type} should not be empty"
-
-
-def test_no_duplicate_fields_in_any_type():
-    """Test that no citation type has duplicate field names."""
-    config = CitationFieldsConfig()
-    all_requirements = config.get_required_for_citation_types()
-
-    for citation_type, fields in all_requirements.items():
-        unique_fields = set(fields)
-        assert len(unique_fields) == len(
-            fields
-        ), f"{citation_type} should not have duplicate fields"
-
-
-def test_common_fields_across_all_types():
-    """Test that all types share common required fields."""
-    config = CitationFieldsConfig()
-    all_requirements = config.get_required_for_citation_types()
-
-    # These fields should be required for all citation types
-    common_fields = {"type", "title", "authors", "year"}
-
-    for citation_type, fields in all_requirements.items():
-        fields_set = set(fields)
-        assert common_fields.issubset(
-            fields_set
-        ), f"{citation_type} should have all common fields: {common_fields}"
-
-
-def test_type_specific_fields():
-    """Test that each citation type has its specific required fields."""
-    config = CitationFieldsConfig()
+    with pytest.raises(TypeError):
+        all_requirements["book"][0] = "fake_field"
+
+    assert "fake_field" not in fields_config.get_required_fields("book")
 
+
+@pytest.mark.parametrize("citation_type", ["book", "article", "website", "report"])
+@pytest.mark.parametrize("field", ["type", "title", "authors", "year"])
+def test_common_required_fields(fields_config, citation_type, field):
+    """Test that every citation type requires the common fields."""
+    assert field in fields_config.get_required_fields(
+        citation_type
+    ), f"'{field}' should be a required field for {citation_type}"
+
+
+def test_type_specific_fields(fields_config):
+    """Test that each citation type has its specific required fields."""
     # Book-specific
-    book_fields = set(config.get_required_fields("book"))
+    book_fields = set(fields_config.get_required_fields("book"))
     assert "publisher" in book_fields
     assert "place" in book_fields
     assert "edition" in book_fields
 
     # Article-specific
-    article_fields = set(config.get_required_fields("article"))
+    article_fields = set(fields_config.get_required_fields("article"))
     assert "journal" in article_fields
     assert "volume" in article_fields
     assert "doi" in article_fields
 
     # Website-specific
-    website_fields = set(config.get_required_fields("website"))
+    website_fields = set(fields_config.get_required_fields("website"))
     assert "url" in website_fields
     assert "access_date" in website_fields
 
     # Report-specific
-    report_fields = set(config.get_required_fields("report"))
+    report_fields = set(fields_config.get_required_fields("report"))
     assert "url" in report_fields
     assert "place" in report_fields
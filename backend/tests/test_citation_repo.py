@@ -1,36 +1,52 @@
 # backend/tests/test_citation_repo.py
+from contextlib import contextmanager
+
 import pytest
-from models.base import Base
 from models.project import Project
 from models.project_citation import ProjectCitation
 from repositories.citation_repo import CitationRepository
 from repositories.project_repo import ProjectRepository
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy import event, exists
 
 
-@pytest.fixture(scope="function")
-def db_session():
-    engine = create_engine(
-        "sqlite:///:memory:", connect_args={"check_same_thread": False}
-    )
-    TestingSessionLocal = sessionmaker(bind=engine)
-    Base.metadata.create_all(engine)
-    db = TestingSessionLocal()
+def _make_project(db, name):
+    """Insert a project and flush so its id is assigned without a commit."""
+    project = Project(name=name)
+    db.add(project)
+    db.flush()
+    return project
+
+
+def _has_association(db, citation_id, project_id=None):
+    """Check for a ProjectCitation row with an EXISTS query, without loading it."""
+    criteria = [ProjectCitation.citation_id == citation_id]
+    if project_id is not None:
+        criteria.append(ProjectCitation.project_id == project_id)
+    return db.query(exists().where(*criteria)).scalar()
+
+
+@contextmanager
+def _count_queries(db):
+    """Collect the SQL statements the session executes inside the block."""
+    statements = []
+    # Start the session's transaction first so its SAVEPOINT is not counted
+    connection = db.connection()
+
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(connection, "before_cursor_execute", _record)
     try:
-        yield db
+        yield statements
     finally:
-        db.close()
+        event.remove(connection, "before_cursor_execute", _record)
 
 
 # Creates a new citation linked to a project and verifies data integrity
 def test_create_citation_linked_to_project(db_session):
     repo = CitationRepository(db_session)
 
-    project = Project(name="Test Project")
-    db_session.add(project)
-    db_session.commit()
-    db_session.refresh(project)
+    project = _make_project(db_session, "Test Project")
 
     created = repo.create(
         project_id=project.id,
@@ -49,10 +65,7 @@ def test_create_citation_linked_to_project(db_session):
 def test_create_identical_citation_reuses_existing(db_session):
     repo = CitationRepository(db_session)
 
-    project = Project(name="Test Project")
-    db_session.add(project)
-    db_session.commit()
-    db_session.refresh(project)
+    project = _make_project(db_session, "Test Project")
 
     citation1 = repo.create(
         project_id=project.id,
@@ -62,27 +75,28 @@ def test_create_identical_citation_reuses_existing(db_session):
         year=2020,
     )
 
-    citation2 = repo.create(
-        project_id=project.id,
-        type="book",
-        title="Identical Book",
-        authors=["Author A"],
-        year=2020,
-    )
+    # Read the id now: the commit in create() expired it, and a reload would count
+    project_id = project.id
+    with _count_queries(db_session) as queries:
+        citation2 = repo.create(
+            project_id=project_id,
+            type="book",
+            title="Identical Book",
+            authors=["Author A"],
+            year=2020,
+        )
 
     assert citation1.id == citation2.id
+    # One lookup for the citation, one for its association; nothing is written
+    assert len(queries) == 2
 
 
 # Creates new association for existing citation when used in different project
 def test_create_identical_citation_different_project(db_session):
     repo = CitationRepository(db_session)
 
-    project1 = Project(name="Project 1")
-    project2 = Project(name="Project 2")
-    db_session.add_all([project1, project2])
-    db_session.commit()
-    db_session.refresh(project1)
-    db_session.refresh(project2)
+    project1 = _make_project(db_session, "Project 1")
+    project2 = _make_project(db_session, "Project 2")
 
     citation1 = repo.create(
         project_id=project1.id,
@@ -102,25 +116,8 @@ def test_create_identical_citation_different_project(db_session):
 
     assert citation1.id == citation2.id
 
-    assoc1 = (
-        db_session.query(ProjectCitation)
-        .filter(
-            ProjectCitation.project_id == project1.id,
-            ProjectCitation.citation_id == citation1.id,
-        )
-        .first()
-    )
-    assoc2 = (
-        db_session.query(ProjectCitation)
-        .filter(
-            ProjectCitation.project_id == project2.id,
-            ProjectCitation.citation_id == citation2.id,
-        )
-        .first()
-    )
-
-    assert assoc1 is not None
-    assert assoc2 is not None
+    assert _has_association(db_session, citation1.id, project1.id)
+    assert _has_association(db_session, citation2.id, project2.id)
 
 
 # Creates citation with all possible optional fields populated
@@ -128,10 +125,7 @@ def test_create_citation_with_all_optional_fields(db_session):
     """Test creating citation with all possible optional fields populated."""
     repo = CitationRepository(db_session)
 
-    project = Project(name="Complete Citation Project")
-    db_session.add(project)
-    db_session.commit()
-    db_session.refresh(project)
+    project = _make_project(db_session, "Complete Citation Project")
 
     citation = repo.create(
         project_id=project.id,
@@ -175,10 +169,7 @@ def test_find_duplicate_citation_case_insensitive(db_session):
     """Test that find_duplicate_citation_in_project detects duplicates with different case."""
     repo = CitationRepository(db_session)
 
-    project = Project(name="Case Test Project")
-    db_session.add(project)
-    db_session.commit()
-    db_session.refresh(project)
+    project = _make_project(db_session, "Case Test Project")
 
     # Create citation with specific case
     original = repo.create(
@@ -207,9 +198,12 @@ def test_find_duplicate_citation_case_insensitive(db_session):
         "edition": None,
     }
 
-    duplicate = repo.find_duplicate_citation_in_project(project.id, test_data)
+    project_id = project.id
+    with _count_queries(db_session) as queries:
+        duplicate = repo.find_duplicate_citation_in_project(project_id, test_data)
     assert duplicate is not None
     assert duplicate.id == original.id
+    assert len(queries) == 1
 
 
 # Verifies case-insensitive comparison doesn't create false positives
@@ -217,10 +211,7 @@ def test_find_duplicate_citation_no_false_positive(db_session):
     """Test that case-insensitive comparison doesn't create false positives."""
     repo = CitationRepository(db_session)
 
-    project = Project(name="False Positive Test Project")
-    db_session.add(project)
-    db_session.commit()
-    db_session.refresh(project)
+    project = _make_project(db_session, "False Positive Test Project")
 
     # Create original citation
     repo.create(
@@ -249,17 +240,17 @@ def test_find_duplicate_citation_no_false_positive(db_session):
         "edition": None,
     }
 
-    duplicate = repo.find_duplicate_citation_in_project(project.id, test_data)
+    project_id = project.id
+    with _count_queries(db_session) as queries:
+        duplicate = repo.find_duplicate_citation_in_project(project_id, test_data)
     assert duplicate is None  # Should not find a duplicate
+    assert len(queries) == 1
 
 # Retrieves citation by ID and verifies all attributes match
 def test_get_citation_by_id(db_session):
     repo = CitationRepository(db_session)
 
-    project = Project(name="Test Project")
-    db_session.add(project)
-    db_session.commit()
-    db_session.refresh(project)
+    project = _make_project(db_session, "Test Project")
 
     created = repo.create(
         project_id=project.id,
@@ -269,8 +260,11 @@ def test_get_citation_by_id(db_session):
         year=2021,
     )
 
-    fetched = repo.get_by_id(created.id)
+    citation_id = created.id
+    with _count_queries(db_session) as queries:
+        fetched = repo.get_by_id(citation_id)
 
+    assert len(queries) == 1
     assert fetched is not None
     assert fetched.id == created.id
     assert fetched.title == "Deep Learning Advances"
@@ -291,19 +285,19 @@ def test_get_citation_by_id_not_found(db_session):
 def test_delete_citation_not_found(db_session):
     repo = CitationRepository(db_session)
 
-    result = repo.delete(999, project_id=1)
+    with _count_queries(db_session) as queries:
+        result = repo.delete(999, project_id=1)
 
     assert result is False
+    # Stops after the failed lookup without querying associations
+    assert len(queries) == 1
 
 
 # Deletes citation and association when only one project uses it
 def test_delete_citation_single_project(db_session):
     repo = CitationRepository(db_session)
 
-    project = Project(name="Project A")
-    db_session.add(project)
-    db_session.commit()
-    db_session.refresh(project)
+    project = _make_project(db_session, "Project A")
 
     citation = repo.create(
         project_id=project.id,
@@ -317,24 +311,15 @@ def test_delete_citation_single_project(db_session):
     assert ok is True
     assert repo.get_by_id(citation.id) is None
 
-    assoc = (
-        db_session.query(ProjectCitation)
-        .filter(ProjectCitation.citation_id == citation.id)
-        .first()
-    )
-    assert assoc is None
+    assert not _has_association(db_session, citation.id)
 
 
 # Removes association but preserves citation when used by multiple projects
 def test_delete_citation_multiple_projects(db_session):
     repo = CitationRepository(db_session)
 
-    project1 = Project(name="Project A")
-    project2 = Project(name="Project B")
-    db_session.add_all([project1, project2])
-    db_session.commit()
-    db_session.refresh(project1)
-    db_session.refresh(project2)
+    project1 = _make_project(db_session, "Project A")
+    project2 = _make_project(db_session, "Project B")
 
     citation = repo.create(
         project_id=project1.id,
@@ -358,24 +343,8 @@ def test_delete_citation_multiple_projects(db_session):
     still_exists = repo.get_by_id(citation.id)
     assert still_exists is not None
 
-    assoc1 = (
-        db_session.query(ProjectCitation)
-        .filter(
-            ProjectCitation.project_id == project1.id,
-            ProjectCitation.citation_id == citation.id,
-        )
-        .first()
-    )
-    assoc2 = (
-        db_session.query(ProjectCitation)
-        .filter(
-            ProjectCitation.project_id == project2.id,
-            ProjectCitation.citation_id == citation.id,
-        )
-        .first()
-    )
-    assert assoc1 is None
-    assert assoc2 is not None
+    assert not _has_association(db_session, citation.id, project1.id)
+    assert _has_association(db_session, citation.id, project2.id)
 
 
 # Deletes orphan citation that has no project associations
@@ -403,12 +372,8 @@ def test_delete_citation_with_none_project_id(db_session):
     """Test deleting citation with project_id=None removes all associations."""
     repo = CitationRepository(db_session)
 
-    project1 = Project(name="Project 1")
-    project2 = Project(name="Project 2")
-    db_session.add_all([project1, project2])
-    db_session.commit()
-    db_session.refresh(project1)
-    db_session.refresh(project2)
+    project1 = _make_project(db_session, "Project 1")
+    project2 = _make_project(db_session, "Project 2")
 
     # Create citation shared by two projects
     citation = repo.create(
@@ -435,88 +400,108 @@ def test_delete_citation_with_none_project_id(db_session):
     assert repo.get_by_id(citation.id) is None
 
     # Verify all associations removed
-    assocs = (
-        db_session.query(ProjectCitation)
-        .filter(ProjectCitation.citation_id == citation.id)
-        .all()
-    )
-    assert len(assocs) == 0
-
-
-# Updates citation fields and verifies changes are applied
-def test_update_citation(db_session):
+    assert not _has_association(db_session, citation.id)
+
+
+# Updates citation fields in place (single project) and verifies changes are applied
+@pytest.mark.parametrize(
+    "initial, changes, expected, authors",
+    [
+        pytest.param(
+            dict(type="book", title="Old Title", authors=["Jane Doe"], year=2000),
+            dict(title="New Title", year=2021),
+            dict(title="New Title", year=2021),
+            [],
+            id="title_and_year",
+        ),
+        pytest.param(
+            dict(type="book", title="Old", authors=["X"], year=1990),
+            dict(title="New", year=2000),
+            dict(title="New", year=2000),
+            [],
+            id="short_title_and_year",
+        ),
+        pytest.param(
+            dict(type="article", title="Authored", authors=["Y"], year=2001),
+            dict(authors=["Y", "Z"]),
+            {},
+            ["Y", "Z"],
+            id="authors",
+        ),
+        pytest.param(
+            dict(
+                type="book",
+                title="Original Title",
+                authors=["Original Author"],
+                year=2020,
+            ),
+            dict(title="Modified Title", year=2021),
+            dict(title="Modified Title", year=2021),
+            ["Original Author"],
+            id="keeps_unchanged_authors",
+        ),
+        # Article allowed fields: type, title, authors, year, journal, volume,
+        # issue, pages, doi; merge_citation_data sets the rest to None
+        pytest.param(
+            dict(
+                type="article",
+                title="Original Title",
+                authors=["Original Author"],
+                year=2020,
+            ),
+            dict(
+                type="article",
+                title="Updated Title",
+                authors=["Updated Author One", "Updated Author Two"],
+                year=2024,
+                journal="New Journal",
+                volume=100,
+                issue="12",
+                pages="500-550",
+                doi="10.9999/new.doi",
+            ),
+            dict(
+                title="Updated Title",
+                year=2024,
+                journal="New Journal",
+                volume=100,
+                issue="12",
+                pages="500-550",
+                doi="10.9999/new.doi",
+                publisher=None,
+                url=None,
+                access_date=None,
+                place=None,
+                edition=None,
+            ),
+            ["Updated Author One", "Updated Author Two"],
+            id="all_article_fields",
+        ),
+    ],
+)
+def test_update_citation_fields(db_session, initial, changes, expected, authors):
     repo = CitationRepository(db_session)
 
-    project = Project(name="Update Project")
-    db_session.add(project)
-    db_session.commit()
-    db_session.refresh(project)
+    project = _make_project(db_session, "Update Project")
 
-    citation = repo.create(
-        project_id=project.id,
-        type="book",
-        title="Old Title",
-        authors=["Jane Doe"],
-        year=2000,
-    )
+    citation = repo.create(project_id=project.id, **initial)
+    original_id = citation.id
 
-    updated = repo.update(
-        citation.id, project_id=project.id, title="New Title", year=2021
-    )
+    updated = repo.update(citation.id, project_id=project.id, **changes)
 
     assert updated is not None
-    assert updated.title == "New Title"
-    assert updated.year == 2021
-
-
-# Updates citation title and year fields specifically
-def test_update_citation_title_and_year(db_session):
-    repo = CitationRepository(db_session)
-
-    project = Project(name="Project TY")
-    db_session.add(project)
-    db_session.commit()
-    db_session.refresh(project)
-
-    c = repo.create(
-        project_id=project.id, type="book", title="Old", authors=["X"], year=1990
-    )
-
-    updated = repo.update(c.id, project_id=project.id, title="New", year=2000)
-    assert updated.title == "New"
-    assert updated.year == 2000
-
-
-# Updates citation authors list
-def test_update_citation_authors(db_session):
-    repo = CitationRepository(db_session)
-
-    project = Project(name="Project Authors")
-    db_session.add(project)
-    db_session.commit()
-    db_session.refresh(project)
-
-    c = repo.create(
-        project_id=project.id,
-        type="article",
-        title="Authored",
-        authors=["Y"],
-        year=2001,
-    )
-
-    updated = repo.update(c.id, project_id=project.id, authors=["Y", "Z"])
-    assert "Y" in updated.authors
-    assert "Z" in updated.authors
+    assert updated.id == original_id
+    for field, value in expected.items():
+        assert getattr(updated, field) == value
+    for author in authors:
+        assert author in updated.authors
 
 
 # Returns None when trying to update non-existent citation
 def test_update_citation_not_found(db_session):
     repo = CitationRepository(db_session)
 
-    project = Project(name="Test Project")
-    db_session.add(project)
-    db_session.commit()
-    db_session.refresh(project)
+    project = _make_project(db_session, "Test Project")
 
     result = repo.update(999, project_id=project.id, title="Doesn't matter")
 
@@ -527,10 +512,7 @@ def test_update_citation_not_found(db_session):
 def test_update_citation_merges_with_existing_identical(db_session):
     repo = CitationRepository(db_session)
     project_repo = ProjectRepository(db_session)
-    project = Project(name="Merge Project")
-    db_session.add(project)
-    db_session.commit()
-    db_session.refresh(project)
+    project = _make_project(db_session, "Merge Project")
 
     existing_citation = repo.create(
         project_id=project.id,
@@ -569,12 +551,8 @@ def test_update_citation_merges_with_existing_identical(db_session):
 def test_update_citation_multiple_projects_creates_new(db_session):
     repo = CitationRepository(db_session)
     project_repo = ProjectRepository(db_session)
-    project1 = Project(name="Project 1")
-    project2 = Project(name="Project 2")
-    db_session.add_all([project1, project2])
-    db_session.commit()
-    db_session.refresh(project1)
-    db_session.refresh(project2)
+    project1 = _make_project(db_session, "Project 1")
+    project2 = _make_project(db_session, "Project 2")
 
     original_citation = repo.create(
         project_id=project1.id,
@@ -586,7 +564,7 @@ def test_update_citation_multiple_projects_creates_new(db_session):
 
     assoc = ProjectCitation(project_id=project2.id, citation_id=original_citation.id)
     db_session.add(assoc)
-    db_session.commit()
+    db_session.flush()
 
     updated = repo.update(
         original_citation.id, project_id=project1.id, title="Updated Title"
@@ -604,44 +582,12 @@ def test_update_citation_multiple_projects_creates_new(db_session):
     assert project2_citations[0].title == "Shared Article"
 
 
-# Modifies citation in place when only one project uses it
-def test_update_citation_single_project_modifies_in_place(db_session):
-    repo = CitationRepository(db_session)
-
-    project = Project(name="Single Project")
-    db_session.add(project)
-    db_session.commit()
-    db_session.refresh(project)
-
-    citation = repo.create(
-        project_id=project.id,
-        type="book",
-        title="Original Title",
-        authors=["Original Author"],
-        year=2020,
-    )
-
-    original_id = citation.id
-
-    updated = repo.update(
-        citation.id, project_id=project.id, title="Modified Title", year=2021
-    )
-
-    assert updated.id == original_id
-    assert updated.title == "Modified Title"
-    assert updated.year == 2021
-    assert "Original Author" in updated.authors
-
-
 # Tests update behavior when changing citation type
 def test_update_citation_changing_type_filters_fields(db_session):
     """Test that updating citation type filters out irrelevant fields."""
     repo = CitationRepository(db_session)
 
-    project = Project(name="Type Change Project")
-    db_session.add(project)
-    db_session.commit()
-    db_session.refresh(project)
+    project = _make_project(db_session, "Type Change Project")
 
     # Create article citation with article-specific fields
     citation = repo.create(
@@ -684,10 +630,7 @@ def test_merge_citation_data_filters_by_type(db_session):
     """Test that merge_citation_data properly filters fields by citation type."""
     repo = CitationRepository(db_session)
 
-    project = Project(name="Merge Test Project")
-    db_session.add(project)
-    db_session.commit()
-    db_session.refresh(project)
+    project = _make_project(db_session, "Merge Test Project")
 
     # Create article with article-specific fields
     citation = repo.create(
@@ -722,10 +665,7 @@ def test_merge_citation_data_converts_authors_list_to_json(db_session):
     """Test that merge_citation_data converts authors list to JSON string."""
     repo = CitationRepository(db_session)
 
-    project = Project(name="Authors Conversion Project")
-    db_session.add(project)
-    db_session.commit()
-    db_session.refresh(project)
+    project = _make_project(db_session, "Authors Conversion Project")
 
     citation = repo.create(
         project_id=project.id,
@@ -751,10 +691,7 @@ def test_update_citation_with_none_values_are_applied(db_session):
     """Test that updating with None values explicitly sets fields to None."""
     repo = CitationRepository(db_session)
 
-    project = Project(name="None Values Project")
-    db_session.add(project)
-    db_session.commit()
-    db_session.refresh(project)
+    project = _make_project(db_session, "None Values Project")
 
     # Create citation with optional fields
     citation = repo.create(
@@ -777,60 +714,6 @@ def test_update_citation_with_none_values_are_applied(db_session):
     assert updated.title == "Book with Edition"
 
 
-# Tests updating all possible citation fields in one operation
-def test_update_citation_all_fields_at_once(db_session):
-    """Test updating all possible citation fields in one update operation."""
-    repo = CitationRepository(db_session)
-
-    project = Project(name="Update All Fields Project")
-    db_session.add(project)
-    db_session.commit()
-    db_session.refresh(project)
-
-    # Create basic citation
-    citation = repo.create(
-        project_id=project.id,
-        type="article",
-        title="Original Title",
-        authors=["Original Author"],
-        year=2020,
-    )
-
-    # Update all article-valid fields at once
-    # Note: merge_citation_data filters fields by type
-    # Article allowed fields: type, title, authors, year, journal, volume, issue, pages, doi
-    updated = repo.update(
-        citation.id,
-        project_id=project.id,
-        type="article",
-        title="Updated Title",
-        authors=["Updated Author One", "Updated Author Two"],
-        year=2024,
-        journal="New Journal",
-        volume=100,
-        issue="12",
-        pages="500-550",
-        doi="10.9999/new.doi",
-    )
-
-    assert updated.title == "Updated Title"
-    assert "Updated Author One" in updated.authors
-    assert "Updated Author Two" in updated.authors
-    assert updated.year == 2024
-    # Article-specific fields
-    assert updated.journal == "New Journal"
-    assert updated.volume == 100
-    assert updated.issue == "12"
-    assert updated.pages == "500-550"
-    assert updated.doi == "10.9999/new.doi"
-    # Fields not allowed for articles should be None (filtered out by merge_citation_data)
-    assert updated.publisher is None  # Not used for articles
-    assert updated.url is None  # Not used for articles
-    assert updated.access_date is None  # Not used for articles
-    assert updated.place is None  # Not used for articles
-    assert updated.edition is None  # Not used for articles
-
-
 # OUT OF LAYER SCOPE TESTS (EXTRA)
 # These tests cover situations that, according to the app’s logic,
 # should never reach the repository layer because they are already
@@ -840,10 +723,7 @@ def test_update_citation_all_fields_at_once(db_session):
 def test_update_citation_with_invalid_field_is_ignored(db_session):
     repo = CitationRepository(db_session)
 
-    project = Project(name="Invalid Field Project")
-    db_session.add(project)
-    db_session.commit()
-    db_session.refresh(project)
+    project = _make_project(db_session, "Invalid Field Project")
 
     citation = repo.create(
         project_id=project.id,
@@ -864,10 +744,7 @@ def test_update_citation_with_invalid_field_is_ignored(db_session):
 def test_update_citation_with_authors_as_string(db_session):
     repo = CitationRepository(db_session)
 
-    project = Project(name="Authors String Project")
-    db_session.add(project)
-    db_session.commit()
-    db_session.refresh(project)
+    project = _make_project(db_session, "Authors String Project")
 
     citation = repo.create(
         project_id=project.id,
@@ -889,10 +766,7 @@ def test_update_citation_with_authors_as_string(db_session):
 def test_update_citation_with_same_values_does_not_duplicate(db_session):
     repo = CitationRepository(db_session)
 
-    project = Project(name="Same Values Project")
-    db_session.add(project)
-    db_session.commit()
-    db_session.refresh(project)
+    project = _make_project(db_session, "Same Values Project")
 
     citation = repo.create(
         project_id=project.id,
@@ -0,0 +1,39 @@
+# backend/tests/test_integration_db_isolation.py
+import pytest
+from db import database
+from models.base import Base
+from models.project import Project
+
+# This module deliberately does not import main: the first real-database test
+# must be the one that triggers the app import inside setup_integration_db
+
+
+def _commit_project_and_count(name):
+    """Commit a project through the patched get_db and return the project count."""
+    session_gen = database.get_db()
+    session = next(session_gen)
+    try:
+        session.add(Project(name=name))
+        session.commit()
+        return session.query(Project).count()
+    finally:
+        session_gen.close()
+
+
+def test_integration_first_test_commits_one_project():
+    """Test that a committed row and create_all on the engine stay in this test."""
+    # What main does at import time must not end the test's outer transaction
+    Base.metadata.create_all(bind=database.engine)
+
+    assert _commit_project_and_count("First Isolation Project") == 1
+
+
+def test_integration_second_test_starts_empty():
+    """Test that the previous test's committed project was rolled back."""
+    assert _commit_project_and_count("Second Isolation Project") == 1
+
+
+def test_integration_engine_rejects_unrouted_calls():
+    """Test that engine calls outside the test's transaction fail loudly."""
+    with pytest.raises(AttributeError, match="raw_connection"):
+        database.engine.raw_connection()
@@ -1,25 +1,12 @@
 # backend/tests/test_integration_validator.py
 import pytest
 from fastapi import HTTPException
+from pydantic import ValidationError
 from repositories.citation_repo import CitationRepository
 from repositories.project_repo import ProjectRepository
+from schemas.citation_schemas import CitationCreate
 from services.citation_service import CitationService
 from services.project_service import ProjectService
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
-
-from models.base import Base
-
-
-@pytest.fixture(scope="function")
-def db_session():
-    """Create a fresh in-memory database for each test."""
-    engine = create_engine("sqlite:///:memory:")
-    Base.metadata.create_all(engine)
-    SessionLocal = sessionmaker(bind=engine)
-    session = SessionLocal()
-    yield session
-    session.close()
 
 
 @pytest.fixture
@@ -338,6 +325,36 @@ def test_update_citation_validates_changes(project_service, citation_service):
     assert exc_info.value.status_code == 400
 
 
+def test_boolean_numeric_fields_rejected(project_service, citation_service):
+    """Test that booleans are not accepted as year, volume, or edition."""
+    project = project_service.create_project({"name": "Boolean Number Test"})
+
+    book = {
+        "type": "book",
+        "title": "Boolean Book",
+        "authors": ["Author"],
+        "year": True,
+        "publisher": "Publisher",
+        "place": "City",
+        "edition": 1
+    }
+
+    with pytest.raises(HTTPException) as exc_info:
+        citation_service.create_citation(project.id, book)
+
+    assert exc_info.value.status_code == 400
+    assert "boolean" in exc_info.value.detail.lower()
+
+    book["year"] = 2023
+    citation = citation_service.create_citation(project.id, book)
+
+    with pytest.raises(HTTPException) as exc_info:
+        citation_service.update_citation(citation.id, project.id, {"edition": False})
+
+    assert exc_info.value.status_code == 400
+    assert "boolean" in exc_info.value.detail.lower()
+
+
 def test_project_name_validation_empty(project_service):
     """Test validation fails for empty project name."""
     with pytest.raises(HTTPException) as exc_info:
@@ -501,6 +518,62 @@ def test_multiple_validation_errors_reported(project_service, citation_service):
     assert "required" in error_detail or "missing" in error_detail
 
 
+def test_create_reports_missing_and_invalid_fields_together():
+    """Test that CitationCreate reports missing and invalid fields in one error."""
+    book_with_journal = {
+        "type": "book",
+        "title": "Mixed Errors Book",
+        "authors": ["Author Name"],
+        "year": 2023,
+        "publisher": "Publisher",
+        "journal": "Not A Book Field",
+        # Missing: place
+    }
+
+    with pytest.raises(ValidationError) as exc_info:
+        CitationCreate(**book_with_journal)
+
+    errors = exc_info.value.errors()
+    assert len(errors) == 1
+    assert errors[0]["msg"] == (
+        "Value error, Missing required book fields: place; "
+        "Invalid fields for book: journal. "
+        "Valid fields: authors, edition, place, publisher, title, type, year"
+    )
+
+
+def test_update_type_change_reports_invalid_and_missing_fields_together(
+    project_service, citation_service
+):
+    """Test that a type change reports invalid and missing fields in one error."""
+    project = project_service.create_project({"name": "Type Change Errors Test"})
+    website = citation_service.create_citation(
+        project.id,
+        {
+            "type": "website",
+            "title": "Website To Convert",
+            "authors": ["Web Author"],
+            "year": 2023,
+            "publisher": "Web Publisher",
+            "url": "https://convert.example.com",
+            "access_date": "2023-12-01",
+        },
+    )
+
+    # journal is not a book field, and place is required for books but not websites
+    with pytest.raises(HTTPException) as exc_info:
+        citation_service.update_citation(
+            website.id, project.id, {"type": "book", "journal": "Some Journal"}
+        )
+
+    assert exc_info.value.status_code == 400
+    assert exc_info.value.detail == (
+        "Invalid fields for new type book: journal. "
+        "Valid fields: authors, edition, place, publisher, title, type, year; "
+        "When changing to type 'book', the following fields are required: place"
+    )
+
+
 def test_validation_allows_optional_fields_missing(project_service, citation_service):
     """Test that validation allows missing optional fields."""
     project = project_service.create_project({"name": "Optional Fields Test"})
@@ -12,6 +12,7 @@ These tests verify basic API infrastructure is working.
 """
 from fastapi.testclient import TestClient
 from main import app
+from models.project import Project
 
 client = TestClient(app)
 
@@ -60,4 +61,18 @@ def test_exception_handling():
     """Test basic exception handling."""
     # Verify framework handles exceptions appropriately
     response = client.get("/nonexistent-route")
-    assert response.status_code == 404
\ No newline at end of file
+    assert response.status_code == 404
+
+
+def test_health_integration_keeps_committed_rows(integration_db_session, monkeypatch):
+    """Test /health connects on the test database without discarding committed data."""
+    monkeypatch.delenv("ENVIRONMENT", raising=False)
+    integration_db_session.add(Project(name="Health Check Project"))
+    integration_db_session.commit()
+
+    response = client.get("/health")
+
+    data = response.json()
+    assert data["status"] == "healthy"
+    assert data["database"] == "connected"
+    assert integration_db_session.query(Project).count() == 1
@@ -1,38 +1,28 @@
 # backend/tests/test_project_repo.py
-import os
-import tempfile
+import json
 import time
 
 import pytest
-from models.base import Base
+from models.citation import Citation
 from models.project_citation import ProjectCitation
 from repositories.citation_repo import CitationRepository
 from repositories.project_repo import ProjectRepository
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import Session
 
 
 @pytest.fixture(scope="function")
-def db_session():
-    # Create a temporary database file
-    fd, db_path = tempfile.mkstemp(suffix=".db")
-    os.close(fd)
-
-    db_url = f"sqlite:///{db_path}"
-    engine = create_engine(
-        db_url, connect_args={"check_same_thread": False}, echo=False
+def db_session(integration_db_connection):
+    # Reuse the session-wide StaticPool in-memory engine from conftest instead
+    # of building a temporary database file per test; writes are rolled back
+    db = Session(
+        bind=integration_db_connection,
+        expire_on_commit=False,  # Keep object attributes after commit
+        join_transaction_mode="create_savepoint",
     )
-    TestingSessionLocal = sessionmaker(
-        bind=engine, expire_on_commit=False  # Keep object attributes after commit
-    )
-    Base.metadata.create_all(engine)
-    db = TestingSessionLocal()
     try:
         yield db
     finally:
         db.close()
-        engine.dispose()
-        os.unlink(db_path)  # Clean up temp file
 
 
 # Creates a new project and verifies it has an ID and correct name
@@ -296,23 +286,34 @@ def test_delete_project_multiple_citations_performance(db_session):
 
     project = project_repo.create({"name": "Performance Test Project"})
 
-    citations = []
-    for i in range(10):
-        citation = citation_repo.create(
-            project_id=project.id,
+    # Insert the fixture rows in two batched flushes and a single commit,
+    # instead of the four statements and two commits repo.create spends per row
+    citations = [
+        Citation(
             type="article",
             title=f"Test Article {i}",
-            authors=[f"Author {i}"],
+            authors=json.dumps([f"Author {i}"]),
             year=2020 + i,
         )
-        citations.append(citation.id)
+        for i in range(10)
+    ]
+    db_session.add_all(citations)
+    db_session.flush()
+    db_session.add_all(
+        ProjectCitation(project_id=project.id, citation_id=citation.id)
+        for citation in citations
+    )
+    db_session.commit()
+    citation_ids = [citation.id for citation in citations]
 
     result = project_repo.delete(project.id)
 
     assert result is True
     assert project_repo.get_by_id(project.id) is None
 
-    for citation_id in citations:
+    # Query rather than Session.get: delete() removes citations with bulk deletes
+    # that leave the loaded objects in the identity map
+    for citation_id in citation_ids:
         assert citation_repo.get_by_id(citation_id) is None
 
     remaining_assocs = (
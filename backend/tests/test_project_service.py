@@ -1,22 +1,8 @@
 # backend/tests/test_project_service.py
 import pytest
 from fastapi import HTTPException
-from models.base import Base
 from services.citation_service import CitationService
 from services.project_service import ProjectService
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
-
-
-@pytest.fixture(scope="function")
-def db_session():
-    """Create a fresh in-memory database for each test."""
-    engine = create_engine("sqlite:///:memory:")
-    Base.metadata.create_all(engine)
-    SessionLocal = sessionmaker(bind=engine)
-    session = SessionLocal()
-    yield session
-    session.close()
 
 
 @pytest.fixture